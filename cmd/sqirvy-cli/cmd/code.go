@@ -32,26 +32,17 @@ The prompt is constructed in this order:
 		temperature := viper.GetFloat64("temperature")
 
 		// Execute the query using the specific code generation prompt
-		response, err := executeQuery(model, temperature, codePrompt, args)
+		err := executeQuery(model, temperature, codePrompt, args)
 		if err != nil {
 			log.Fatalf("Error executing code command: %v", err)
 		}
-		// Print the LLM response to standard output
-		fmt.Print(response)
-		fmt.Println() // Ensure a newline at the end
+		// The response has been streamed to standard output, end it with a newline
+		fmt.Println()
 	},
 }
 
-// codeUsage prints the usage instructions for the code command.
-func codeUsage(cmd *cobra.Command) error {
-	fmt.Println("Usage: stdin | sqirvy-cli code [flags] [files| urls]")
-	fmt.Println("\nFlags:")
-	cmd.Flags().PrintDefaults()
-	return nil
-}
-
 // init registers the code command with the root command and sets its custom usage function.
 func init() {
 	rootCmd.AddCommand(codeCmd)
-	codeCmd.SetUsageFunc(codeUsage)
+	codeCmd.SetUsageFunc(usageFunc("Usage: stdin | sqirvy-cli code [flags] [files| urls]"))
 }
@@ -14,6 +14,7 @@ import (
 
 // executeQuery processes and executes an AI model query with the given system prompt and arguments.
 // It handles model selection, temperature settings, and communication with the AI provider.
+// The response is streamed to stdout as it arrives, so it is not returned.
 //
 // Parameters:
 //   - cmd: The Cobra command instance containing parsed flags
@@ -21,9 +22,13 @@ import (
 //   - args: Additional arguments to be processed as part of the query
 //
 // Returns:
-//   - string: The model's response text
 //   - error: Any error encountered during execution
-func executeQuery(model string, temperature float64, system string, args []string) (string, error) {
+func executeQuery(model string, temperature float64, system string, args []string) error {
+	// validate the temperature once, after flags and config have been merged
+	if temperature < minTemperature || temperature > maxTemperature {
+		return fmt.Errorf("error: temperature %v is out of range (%.1f to %.1f)", temperature, minTemperature, maxTemperature)
+	}
+
 	// check if it has an alias
 	model = sqirvy.GetModelAlias(model)
 
@@ -33,29 +38,35 @@ func executeQuery(model string, temperature float64, system string, args []strin
 	// Process system prompt and arguments into query prompts
 	prompts, err := ReadPrompt(args)
 	if err != nil {
-		return "", fmt.Errorf("error: reading prompt:[]string{\n%v", err)
+		return fmt.Errorf("error: reading prompt: %w", err)
 	}
 
 	// Determine the AI provider based on the selected model
 	provider, err := sqirvy.GetProviderName(model)
 	if err != nil {
-		return "", fmt.Errorf("error: model is not supported %s: %v", model, err)
+		return fmt.Errorf("error: model is not supported %s: %w", model, err)
 	}
 
-	// Create client for the provider
+	// Create client for the provider, it is owned by the client cache and not closed here
 	client, err := sqirvy.NewClient(provider)
 	if err != nil {
-		return "", fmt.Errorf("error: creating client for provider %s: %v", provider, err)
+		return fmt.Errorf("error: creating client for provider %s: %w", provider, err)
 	}
-	defer client.Close()
 
-	// Configure query options and execute the query
-	options := sqirvy.Options{Temperature: float32(temperature), MaxTokens: sqirvy.GetMaxTokens(model)}
+	// Configure query options and execute the query.
+	// The client applies the model's token limit from the same lookup that validates the model.
+	// The response is streamed to stdout as it arrives, so output starts with the first token.
+	options := sqirvy.Options{Temperature: float32(temperature), StreamFunc: streamToStdout}
 	ctx := context.Background()
-	response, err := client.QueryText(ctx, system, prompts, model, options)
-	if err != nil {
-		return "", fmt.Errorf("error: querying model %s: %v", model, err)
+	if _, err := client.QueryText(ctx, system, prompts, model, options); err != nil {
+		return fmt.Errorf("error: querying model %s: %w", model, err)
 	}
 
-	return response, nil
+	return nil
+}
+
+// streamToStdout writes each chunk of a streamed response to stdout as it arrives.
+func streamToStdout(ctx context.Context, chunk []byte) error {
+	_, err := os.Stdout.Write(chunk)
+	return err
 }
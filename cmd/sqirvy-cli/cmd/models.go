@@ -7,6 +7,7 @@ import (
 	_ "embed"
 	"fmt"
 	"sort"
+	"strings"
 
 	sqirvy "dmh2000/sqirvy-cli/pkg/sqirvy"
 
@@ -38,26 +39,22 @@ var modelsCmd = &cobra.Command{
 		// Sort the formatted list alphabetically
 		sort.Strings(mptext)
 
-		// Print the header and the sorted list
-		fmt.Println("Supported Providers and Models:")
+		// Assemble the header and the sorted list, then print it in a single write
+		var out strings.Builder
+		out.WriteString("Supported Providers and Models:\n")
 		for _, m := range mptext {
-			fmt.Println(m)
+			out.WriteString(m)
+			out.WriteByte('\n')
 		}
-		fmt.Println() // Add a trailing newline for cleaner output
+		out.WriteByte('\n') // Add a trailing newline for cleaner output
+		fmt.Print(out.String())
 	},
 }
 
-// modelsUsage prints the usage instructions for the models command.
-func modelsUsage(cmd *cobra.Command) error {
-	fmt.Println("Usage: sqirvy-cli models")
-	// No flags specific to this command, but persistent flags apply.
-	fmt.Println("\nFlags:")
-	cmd.PersistentFlags().PrintDefaults()
-	return nil
-}
-
 // init registers the models command with the root command and sets its custom usage function.
 func init() {
 	rootCmd.AddCommand(modelsCmd)
-	modelsCmd.SetUsageFunc(modelsUsage)
+	// models lists the built-in model table and does not need the config file
+	modelsCmd.PersistentPreRun = func(cmd *cobra.Command, args []string) {}
+	modelsCmd.SetUsageFunc(usageFunc("Usage: sqirvy-cli models"))
 }
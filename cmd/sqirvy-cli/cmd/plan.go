@@ -33,26 +33,17 @@ The prompt is constructed in this order:
 		temperature := viper.GetFloat64("temperature")
 
 		// Execute the query using the specific planning prompt
-		response, err := executeQuery(model, temperature, planPrompt, args)
+		err := executeQuery(model, temperature, planPrompt, args)
 		if err != nil {
 			log.Fatalf("Error executing plan command: %v", err)
 		}
-		// Print the LLM response to standard output
-		fmt.Print(response)
-		fmt.Println() // Ensure a newline at the end
+		// The response has been streamed to standard output, end it with a newline
+		fmt.Println()
 	},
 }
 
-// planUsage prints the usage instructions for the plan command.
-func planUsage(cmd *cobra.Command) error {
-	fmt.Println("Usage: stdin | sqirvy-cli plan [flags] [files| urls]")
-	fmt.Println("\nFlags:")
-	cmd.Flags().PrintDefaults()
-	return nil
-}
-
 // init registers the plan command with the root command and sets its custom usage function.
 func init() {
 	rootCmd.AddCommand(planCmd)
-	planCmd.SetUsageFunc(planUsage)
+	planCmd.SetUsageFunc(usageFunc("Usage: stdin | sqirvy-cli plan [flags] [files| urls]"))
 }
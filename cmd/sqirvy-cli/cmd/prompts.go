@@ -5,9 +5,13 @@ package cmd
 import (
 	util "dmh2000/sqirvy-cli/pkg/util"
 	_ "embed"
+	"errors"
 	"fmt"
 	"net"
 	"net/url"
+	"strings"
+	"sync"
+	"sync/atomic"
 )
 
 // queryPrompt contains the embedded content of the query.md file,
@@ -34,6 +38,44 @@ var codePrompt string
 //go:embed prompts/review.md
 var reviewPrompt string
 
+// init strips the markdown fences from the embedded prompts once at startup,
+// so the fence lines and surrounding whitespace are not sent with every request.
+func init() {
+	queryPrompt = stripPromptFence(queryPrompt)
+	planPrompt = stripPromptFence(planPrompt)
+	codePrompt = stripPromptFence(codePrompt)
+	reviewPrompt = stripPromptFence(reviewPrompt)
+}
+
+// stripPromptFence removes the markdown code fence wrapping a prompt file
+// (an opening line such as "```prompt" and the closing "```") together with
+// any leading and trailing whitespace. Prompts without a fence are only trimmed.
+func stripPromptFence(prompt string) string {
+	prompt = strings.TrimSpace(prompt)
+	if !strings.HasPrefix(prompt, "```") {
+		return prompt
+	}
+	if i := strings.IndexByte(prompt, '\n'); i >= 0 {
+		prompt = prompt[i+1:]
+	} else {
+		prompt = ""
+	}
+	return strings.TrimSpace(strings.TrimSuffix(prompt, "```"))
+}
+
+// urlSchemes is the set of URL schemes that are scraped rather than read as files.
+var urlSchemes = map[string]bool{
+	"http":  true,
+	"https": true,
+}
+
+// hasURLPrefix reports whether arg starts with one of urlSchemes followed by "://".
+// It is a cheap check that lets file paths skip URL parsing entirely.
+func hasURLPrefix(arg string) bool {
+	scheme, _, ok := strings.Cut(arg, "://")
+	return ok && urlSchemes[strings.ToLower(scheme)]
+}
+
 // ReadPrompt processes input from standard input (stdin), URLs, and local files,
 // combining them into a slice of strings suitable for use as prompts.
 // It ensures the total size of all inputs does not exceed MaxInputTotalBytes.
@@ -61,7 +103,9 @@ func ReadPrompt(args []string) ([]string, error) {
 	}
 	// Add markers only if stdinData is not empty
 	if len(stdinData) > 0 {
-		markedStdinData := fmt.Sprintf("--- START STDIN ---\n%s\n--- END STDIN ---", stdinData)
+		// plain concatenation builds the marked prompt with a single allocation,
+		// so a large piped input is copied once rather than formatted through fmt
+		markedStdinData := "--- START STDIN ---\n" + stdinData + "\n--- END STDIN ---"
 		prompts = append(prompts, markedStdinData)
 		length += int64(len(markedStdinData))
 		if length > MaxInputTotalBytes {
@@ -72,52 +116,12 @@ func ReadPrompt(args []string) ([]string, error) {
 		prompts = append(prompts, "")
 	}
 
-	// Process each argument which can be either a URL or a file path
-	for _, arg := range args {
-		// Attempt to parse argument as URL
-		parsedURL, err := url.ParseRequestURI(arg)
-		if err == nil && (parsedURL.Scheme == "http" || parsedURL.Scheme == "https") {
-			// Basic URL format is valid, now check for potential SSRF
-			hostname := parsedURL.Hostname()
-			ips, err := net.LookupIP(hostname)
-			if err != nil {
-				return nil, fmt.Errorf("error: could not resolve hostname for URL %s: %w", arg, err)
-			}
-
-			for _, ip := range ips {
-				if ip.IsLoopback() || ip.IsPrivate() || ip.IsLinkLocalUnicast() || ip.IsLinkLocalMulticast() {
-					return nil, fmt.Errorf("error: URL %s resolves to a non-public IP address %s, potential SSRF detected", arg, ip.String())
-				}
-			}
-
-			// Hostname resolves to public IPs, proceed with scraping
-			content, err := util.ScrapeURL(arg)
-			if err != nil {
-				return nil, fmt.Errorf("error: failed to scrape URL %s: %w", arg, err)
-			}
-			// Add markers around URL content
-			markedContent := fmt.Sprintf("--- START URL: %s ---\n%s\n--- END URL: %s ---", arg, content, arg)
-			prompts = append(prompts, markedContent)
-			length += int64(len(markedContent))
-			if length > MaxInputTotalBytes {
-				return nil, fmt.Errorf("error: total size would exceed limit of %d bytes (urls)", MaxInputTotalBytes)
-			}
-			continue
-		}
-
-		// Handle file content if not a URL
-		fileData, _, err := util.ReadFile(arg, MaxInputTotalBytes)
-		if err != nil {
-			return nil, fmt.Errorf("error: failed to read file %s: %w", arg, err)
-		}
-		// Add markers around file content
-		markedFileData := fmt.Sprintf("--- START FILE: %s ---\n%s\n--- END FILE: %s ---", arg, string(fileData), arg)
-		prompts = append(prompts, markedFileData)
-		length += int64(len(markedFileData))
-		if length > MaxInputTotalBytes {
-			return nil, fmt.Errorf("error: total size would exceed limit of %d bytes (files)", MaxInputTotalBytes)
-		}
+	// Read the arguments, which can be either URLs or file paths
+	argPrompts, err := readArgs(args, length, readSource)
+	if err != nil {
+		return nil, err
 	}
+	prompts = append(prompts, argPrompts...)
 
 	// Check if any actual content was added (beyond the initial potentially empty stdin prompt)
 	hasContent := false
@@ -138,3 +142,135 @@ func ReadPrompt(args []string) ([]string, error) {
 
 	return prompts, nil
 }
+
+// maxConcurrentSources limits the number of files and URLs ReadPrompt reads at the same time
+const maxConcurrentSources = 16
+
+// errSourceSkipped marks an argument that was not read because reading another
+// argument failed or the size limit was already exceeded
+var errSourceSkipped = errors.New("skipped")
+
+// readArgs reads the file and URL arguments concurrently with read and returns
+// their marked content in argument order. length is the size of the prompts
+// gathered so far, which counts towards MaxInputTotalBytes.
+//
+// An argument given more than once is read once and its content reused.
+// Once a read fails or the size limit is exceeded, arguments that have not
+// started yet are skipped instead of being read, resolved or scraped.
+func readArgs(args []string, length int64, read func(arg string) promptSource) ([]string, error) {
+	// index of each argument's first occurrence, and how often it is repeated
+	index := make(map[string]int, len(args))
+	unique := make([]string, 0, len(args))
+	count := make([]int64, 0, len(args))
+	for _, arg := range args {
+		i, ok := index[arg]
+		if !ok {
+			i = len(unique)
+			index[arg] = i
+			unique = append(unique, arg)
+			count = append(count, 0)
+		}
+		count[i]++
+	}
+
+	sources := make([]promptSource, len(unique))
+	if len(unique) == 1 {
+		sources[0] = read(unique[0])
+	} else {
+		// the running total counts every occurrence of an argument, as the prompts do
+		var total atomic.Int64
+		total.Store(length)
+		var failed atomic.Bool
+		sem := make(chan struct{}, maxConcurrentSources)
+		var wg sync.WaitGroup
+		for i, arg := range unique {
+			wg.Add(1)
+			go func(i int, arg string) {
+				defer wg.Done()
+				sem <- struct{}{}
+				defer func() { <-sem }()
+				if failed.Load() {
+					sources[i] = promptSource{err: errSourceSkipped}
+					return
+				}
+				src := read(arg)
+				if src.err != nil || total.Add(int64(len(src.content))*count[i]) > MaxInputTotalBytes {
+					failed.Store(true)
+				}
+				sources[i] = src
+			}(i, arg)
+		}
+		wg.Wait()
+	}
+
+	// Add the results in argument order and check the size limit. A skipped
+	// argument is passed over, the failure that caused the skip is reported.
+	prompts := make([]string, 0, len(args))
+	for _, arg := range args {
+		src := sources[index[arg]]
+		if src.err == errSourceSkipped {
+			continue
+		}
+		if src.err != nil {
+			return nil, src.err
+		}
+		prompts = append(prompts, src.content)
+		length += int64(len(src.content))
+		if length > MaxInputTotalBytes {
+			return nil, fmt.Errorf("error: total size would exceed limit of %d bytes (%s)", MaxInputTotalBytes, src.kind)
+		}
+	}
+
+	return prompts, nil
+}
+
+// promptSource holds the marked content read from a single file or URL argument.
+type promptSource struct {
+	content string
+	kind    string // "urls" or "files", reported when the size limit is exceeded
+	err     error
+}
+
+// readSource reads a single file or URL argument and wraps its content in start/end markers.
+func readSource(arg string) promptSource {
+	// Attempt to parse argument as URL, only if it looks like one
+	if hasURLPrefix(arg) {
+		if parsedURL, err := url.ParseRequestURI(arg); err == nil {
+			return readURL(arg, parsedURL)
+		}
+	}
+
+	// Handle file content if not a URL
+	fileData, _, err := util.ReadFile(arg, MaxInputTotalBytes)
+	if err != nil {
+		return promptSource{err: fmt.Errorf("error: failed to read file %s: %w", arg, err)}
+	}
+	// Add markers around file content
+	markedFileData := "--- START FILE: " + arg + " ---\n" + string(fileData) + "\n--- END FILE: " + arg + " ---"
+	return promptSource{content: markedFileData, kind: "files"}
+}
+
+// readURL scrapes a single URL argument and wraps its content in start/end markers.
+func readURL(arg string, parsedURL *url.URL) promptSource {
+	// Basic URL format is valid, now check for potential SSRF
+	hostname := parsedURL.Hostname()
+	ips, err := net.LookupIP(hostname)
+	if err != nil {
+		return promptSource{err: fmt.Errorf("error: could not resolve hostname for URL %s: %w", arg, err)}
+	}
+
+	for _, ip := range ips {
+		if ip.IsLoopback() || ip.IsPrivate() || ip.IsLinkLocalUnicast() || ip.IsLinkLocalMulticast() {
+			return promptSource{err: fmt.Errorf("error: URL %s resolves to a non-public IP address %s, potential SSRF detected", arg, ip.String())}
+		}
+	}
+
+	// Hostname resolves to public IPs, proceed with scraping
+	content, err := util.ScrapeURL(arg)
+	if err != nil {
+		return promptSource{err: fmt.Errorf("error: failed to scrape URL %s: %w", arg, err)}
+	}
+	// Add markers around URL content
+	markedContent := fmt.Sprintf("--- START URL: %s ---\n%s\n--- END URL: %s ---", arg, content, arg)
+	return promptSource{content: markedContent, kind: "urls"}
+}
@@ -0,0 +1,127 @@
+package cmd
+
+import (
+	"errors"
+	"strings"
+	"sync"
+	"testing"
+)
+
+func TestStripPromptFence(t *testing.T) {
+	tests := []struct {
+		name   string
+		prompt string
+		want   string
+	}{
+		{name: "Fenced prompt", prompt: "```prompt\nYou are an assistant.\n```\n\n", want: "You are an assistant."},
+		{name: "Other fence tag", prompt: "```plan\nMake a plan.\n```", want: "Make a plan."},
+		{name: "Unfenced prompt", prompt: "  You are an assistant.\n", want: "You are an assistant."},
+		{name: "Fence only", prompt: "```", want: ""},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := stripPromptFence(tt.prompt); got != tt.want {
+				t.Errorf("stripPromptFence() = %q, want %q", got, tt.want)
+			}
+		})
+	}
+}
+
+func TestEmbeddedPromptsUnfenced(t *testing.T) {
+	prompts := map[string]string{
+		"query":  queryPrompt,
+		"plan":   planPrompt,
+		"code":   codePrompt,
+		"review": reviewPrompt,
+	}
+	for name, prompt := range prompts {
+		if prompt == "" {
+			t.Errorf("%s prompt is empty", name)
+		}
+		// an indented fence at the end belongs to an example inside the prompt
+		if strings.HasPrefix(prompt, "```") || strings.HasSuffix(prompt, "\n```") {
+			t.Errorf("%s prompt still has its markdown fence", name)
+		}
+	}
+}
+
+func TestHasURLPrefix(t *testing.T) {
+	tests := []struct {
+		arg  string
+		want bool
+	}{
+		{arg: "https://example.com", want: true},
+		{arg: "http://example.com/page", want: true},
+		{arg: "HTTPS://example.com", want: true},
+		{arg: "ftp://example.com", want: false},
+		{arg: "main.go", want: false},
+		{arg: "dir/http://file", want: false},
+		{arg: "", want: false},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.arg, func(t *testing.T) {
+			if got := hasURLPrefix(tt.arg); got != tt.want {
+				t.Errorf("hasURLPrefix(%q) = %v, want %v", tt.arg, got, tt.want)
+			}
+		})
+	}
+}
+
+// countingReader returns a read function for readArgs that records how often
+// each argument is read and answers from contents
+type countingReader struct {
+	mu       sync.Mutex
+	reads    map[string]int
+	contents map[string]string
+}
+
+func (r *countingReader) read(arg string) promptSource {
+	r.mu.Lock()
+	r.reads[arg]++
+	r.mu.Unlock()
+	content, ok := r.contents[arg]
+	if !ok {
+		return promptSource{err: errors.New("error: failed to read file " + arg)}
+	}
+	return promptSource{content: content, kind: "files"}
+}
+
+func TestReadArgs(t *testing.T) {
+	reader := &countingReader{
+		reads:    map[string]int{},
+		contents: map[string]string{"a": "A", "b": "B", "c": "C"},
+	}
+
+	// prompts follow the argument order, repeated arguments are read once
+	got, err := readArgs([]string{"c", "a", "b", "a", "c"}, 0, reader.read)
+	if err != nil {
+		t.Fatalf("readArgs() error = %v", err)
+	}
+	want := []string{"C", "A", "B", "A", "C"}
+	if strings.Join(got, ",") != strings.Join(want, ",") {
+		t.Errorf("readArgs() = %v, want %v", got, want)
+	}
+	for arg, n := range reader.reads {
+		if n != 1 {
+			t.Errorf("readArgs() read %q %d times, want 1", arg, n)
+		}
+	}
+
+	// a failed read is reported
+	if _, err := readArgs([]string{"a", "missing", "b"}, 0, reader.read); err == nil || !strings.Contains(err.Error(), "missing") {
+		t.Errorf("readArgs() error = %v, want error for missing", err)
+	}
+
+	// repeated arguments count towards the size limit each time they appear
+	reader.contents["big"] = strings.Repeat("x", MaxInputTotalBytes/2+1)
+	if _, err := readArgs([]string{"big", "big"}, 0, reader.read); err == nil || !strings.Contains(err.Error(), "exceed limit") {
+		t.Errorf("readArgs() error = %v, want size limit error", err)
+	}
+
+	// the size of the prompts read before the arguments counts too
+	if _, err := readArgs([]string{"a"}, MaxInputTotalBytes, reader.read); err == nil {
+		t.Error("readArgs() error = nil, want size limit error")
+	}
+}
@@ -29,26 +29,17 @@ in the order specified.
 		temperature := viper.GetFloat64("temperature")
 
 		// Execute the query using the generic query prompt
-		response, err := executeQuery(model, temperature, queryPrompt, args)
+		err := executeQuery(model, temperature, queryPrompt, args)
 		if err != nil {
 			log.Fatalf("Error executing query command: %v", err)
 		}
-		// Print the LLM response to standard output
-		fmt.Print(response)
-		fmt.Println() // Ensure a newline at the end
+		// The response has been streamed to standard output, end it with a newline
+		fmt.Println()
 	},
 }
 
-// queryUsage prints the usage instructions for the query command.
-func queryUsage(cmd *cobra.Command) error {
-	fmt.Println("Usage: stdin | sqirvy-cli query [flags] [files| urls]")
-	fmt.Println("\nFlags:")
-	cmd.Flags().PrintDefaults()
-	return nil
-}
-
 // init registers the query command with the root command and sets its custom usage function.
 func init() {
 	rootCmd.AddCommand(queryCmd)
-	queryCmd.SetUsageFunc(queryUsage)
+	queryCmd.SetUsageFunc(usageFunc("Usage: stdin | sqirvy-cli query [flags] [files| urls]"))
 }
@@ -32,26 +32,17 @@ The prompt is constructed in this order:
 		temperature := viper.GetFloat64("temperature")
 
 		// Execute the query using the specific code review prompt
-		response, err := executeQuery(model, temperature, reviewPrompt, args)
+		err := executeQuery(model, temperature, reviewPrompt, args)
 		if err != nil {
 			log.Fatalf("Error executing review command: %v", err)
 		}
-		// Print the LLM response (the review) to standard output
-		fmt.Print(response)
-		fmt.Println() // Ensure a newline at the end
+		// The response has been streamed to standard output, end it with a newline
+		fmt.Println()
 	},
 }
 
-// reviewUsage prints the usage instructions for the review command.
-func reviewUsage(cmd *cobra.Command) error {
-	fmt.Println("Usage: stdin | sqirvy-cli review [flags] [files| urls]")
-	fmt.Println("\nFlags:")
-	cmd.Flags().PrintDefaults()
-	return nil
-}
-
 // init registers the review command with the root command and sets its custom usage function.
 func init() {
 	rootCmd.AddCommand(reviewCmd)
-	reviewCmd.SetUsageFunc(reviewUsage)
+	reviewCmd.SetUsageFunc(usageFunc("Usage: stdin | sqirvy-cli review [flags] [files| urls]"))
 }
@@ -5,7 +5,9 @@ package cmd
 
 import (
 	"fmt"
+	"io"
 	"os"
+	"strings"
 
 	"github.com/spf13/cobra"
 	"github.com/spf13/viper"
@@ -17,6 +19,12 @@ var defaultPrompt = "Hello"
 const defaultModel = "gemini-2.5-flash-preview-04-17"
 const defaultTemperature = 0.5
 
+// valid range of the temperature flag
+const (
+	minTemperature = 0.0
+	maxTemperature = 1.0
+)
+
 // rootCmd represents the base command when called without any subcommands
 var rootCmd = &cobra.Command{
 	Use:   "sqirvy-cli [command] [flags] [files| urls]",
@@ -35,19 +43,27 @@ var rootCmd = &cobra.Command{
 	// Run defines the behavior when the root command is executed without subcommands.
 	// It defaults to executing the 'query' command with the provided arguments.
 	Run: func(cmd *cobra.Command, args []string) {
-		// If no command is specified, prepend 'query' to the arguments
-		// and execute the command again. This makes 'query' the default command.
-		queryArgs := append([]string{"query"}, args...)
-		cmd.SetArgs(queryArgs)
-		if err := cmd.Execute(); err != nil {
-			// Error during execution is typically handled by Cobra itself,
-			// but we catch it here just in case.
-			fmt.Fprintf(os.Stderr, "Error executing default command 'query': %v\n", err)
-			os.Exit(1)
-		}
+		// If no command is specified, run the 'query' command directly with the
+		// already parsed arguments. This makes 'query' the default command
+		// without parsing the command line and loading the config a second time.
+		queryCmd.Run(queryCmd, args)
 	},
 }
 
+// usageFunc returns a cobra usage function that prints the given usage line
+// followed by the flags accepted by the command. The text is assembled first
+// and written to the command output in a single call.
+func usageFunc(usage string) func(cmd *cobra.Command) error {
+	return func(cmd *cobra.Command) error {
+		var text strings.Builder
+		text.WriteString(usage)
+		text.WriteString("\n\nFlags:\n")
+		text.WriteString(cmd.Flags().FlagUsages())
+		_, err := io.WriteString(cmd.OutOrStdout(), text.String())
+		return err
+	}
+}
+
 // Execute adds all child commands to the root command and sets flags appropriately.
 // This is called by main.main(). It only needs to happen once to the rootCmd.
 func Execute() {
@@ -60,8 +76,11 @@ func Execute() {
 // init sets up the application's persistent flags and initializes configuration handling.
 // It defines flags common to all commands, such as model selection and temperature.
 func init() {
-	// Register the initConfig function to run when Cobra initializes.
-	cobra.OnInitialize(initConfig)
+	// Load the configuration in a run hook on the root command, so that a
+	// subcommand that does not need it (models) can override the hook.
+	rootCmd.PersistentPreRun = func(cmd *cobra.Command, args []string) {
+		initConfig()
+	}
 
 	// Define persistent flags available to the root command and all subcommands.
 	rootCmd.PersistentFlags().StringVar(&cfgFile, "config", "", "config file (default is $HOME/.config/sqirvy-cli/config.yaml)") // Example if config file flag was used
@@ -76,9 +95,6 @@ func init() {
 	viper.BindPFlag("temperature", rootCmd.PersistentFlags().Lookup("temperature")) // Bind flag to Viper config
 }
 
-// configPrinted ensures the config file path is printed only once to stderr.
-var configPrinted bool
-
 // initConfig reads in configuration settings from a config file (if found)
 // and environment variables. Viper handles the precedence (flags > env > config).
 func initConfig() {
@@ -100,9 +116,6 @@ func initConfig() {
 
 	// If a config file is found, read it in.
 	if err := viper.ReadInConfig(); err == nil {
-		if !configPrinted {
-			configPrinted = true
-			fmt.Fprintln(os.Stderr, "Config file :", viper.ConfigFileUsed())
-		}
+		fmt.Fprintln(os.Stderr, "Config file :", viper.ConfigFileUsed())
 	}
 }
@@ -2,21 +2,20 @@
 package sqirvy
 
 import (
-	"context"
 	"fmt"
 	"os"
 	"strings"
 
-	"github.com/tmc/langchaingo/llms"
 	"github.com/tmc/langchaingo/llms/anthropic"
 )
 
+const anthropic_temperature_scale = 1.0
+
 // AnthropicClient implements the Client interface for Anthropic's API.
 // It provides methods for querying Anthropic's language models through
 // the langchaingo library.
 type AnthropicClient struct {
-	llm              llms.Model // langchaingo LLM client
-	temperatureScale float32
+	langchainClient
 }
 
 // Ensure AnthropicClient implements the Client interface
@@ -49,35 +48,10 @@ func NewAnthropicClient() (*AnthropicClient, error) {
 		return nil, fmt.Errorf("failed to create Anthropic client (check API key and network): %w", err)
 	}
 
-	return &AnthropicClient{
+	return &AnthropicClient{langchainClient{
 		llm:              llm,
-		temperatureScale: 1.0, // Default temperature scale for Anthropic
-	}, nil
-}
-
-// QueryText sends a text query to the specified Anthropic model using langchaingo and returns the response.
-//
-// It takes a context, system prompt, a list of prompts, the model name, and options as input.
-// It returns the generated text or an error if the query fails or the model is invalid.
-// Request timeouts are handled by the input context
-func (c *AnthropicClient) QueryText(ctx context.Context, system string, prompts []string, model string, options Options) (string, error) {
-	// validate the model
-	provider, err := GetProviderName(model)
-	if err != nil || provider != Anthropic {
-		return "", fmt.Errorf("invalid or unsupported Anthropic model: %s", model)
-	}
-
-	// scale the temperature
-	options.Temperature = options.Temperature * c.temperatureScale
-	options.MaxTokens = GetMaxTokens(model)
-	return queryTextLangChain(ctx, c.llm, system, prompts, model, options)
-}
-
-// Close implements the Close method for the Client interface.
-//
-// For the Anthropic client, this method does not require any action as the
-// underlying langchaingo client does not need to be explicitly closed.
-func (c *AnthropicClient) Close() error {
-	// the langchaingo llm does not require explicit close
-	return nil
+		provider:         Anthropic,
+		name:             "Anthropic",
+		temperatureScale: anthropic_temperature_scale,
+	}}, nil
 }
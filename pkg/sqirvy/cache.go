@@ -0,0 +1,138 @@
+// Package sqirvy provides an optional on-disk cache for query responses.
+//
+// When the SQIRVY_CACHE environment variable is set to 1, the response to a
+// query is stored under the user cache directory, keyed by a hash of the
+// request. An identical request made within cacheExpiry is answered from the
+// cache without contacting the provider.
+package sqirvy
+
+import (
+	"crypto/sha256"
+	"encoding/hex"
+	"encoding/json"
+	"os"
+	"path/filepath"
+	"strings"
+	"time"
+)
+
+const (
+	// cacheEnvVar enables the response cache when set to "1"
+	cacheEnvVar = "SQIRVY_CACHE"
+
+	// cacheExpiry is how long a cached response remains valid
+	cacheExpiry = 24 * time.Hour
+)
+
+// cacheEnabled reports whether the response cache is turned on.
+func cacheEnabled() bool {
+	return os.Getenv(cacheEnvVar) == "1"
+}
+
+// responseCacheDir returns the directory that holds cached responses.
+func responseCacheDir() (string, error) {
+	dir, err := os.UserCacheDir()
+	if err != nil {
+		return "", err
+	}
+	return filepath.Join(dir, "sqirvy"), nil
+}
+
+// normalizeForCache removes differences in text that do not change its meaning to
+// the model: Windows line endings and leading or trailing whitespace. Whitespace
+// inside the text is kept, since indentation is significant in source files.
+func normalizeForCache(text string) string {
+	return strings.TrimSpace(strings.ReplaceAll(text, "\r\n", "\n"))
+}
+
+// cacheEndpoint identifies where requests for provider are sent. OpenAI-compatible
+// providers can be pointed at another server with <PROVIDER>_BASE_URL, and two
+// servers serving the same model name must not share cached responses.
+func cacheEndpoint(provider string) string {
+	return provider + "|" + os.Getenv(strings.ToUpper(provider)+"_BASE_URL")
+}
+
+// cacheKey returns a hex encoded SHA-256 hash of everything that determines a response.
+// Requests whose text differs only as described in normalizeForCache share a key.
+func cacheKey(endpoint string, system string, prompts []string, model string, options Options) string {
+	normalized := make([]string, len(prompts))
+	for i, prompt := range prompts {
+		normalized[i] = normalizeForCache(prompt)
+	}
+	// encode the request straight into the hash, without an intermediate buffer
+	h := sha256.New()
+	json.NewEncoder(h).Encode(struct {
+		Endpoint    string   `json:"endpoint"`
+		System      string   `json:"system"`
+		Prompts     []string `json:"prompts"`
+		Model       string   `json:"model"`
+		Temperature float32  `json:"temperature"`
+		MaxTokens   int64    `json:"max_tokens"`
+	}{endpoint, normalizeForCache(system), normalized, model, options.Temperature, options.MaxTokens})
+	return hex.EncodeToString(h.Sum(nil))
+}
+
+// cacheGet returns the cached response for key if it exists and has not expired.
+// An expired entry is removed.
+func cacheGet(dir string, key string) (string, bool) {
+	path := filepath.Join(dir, key)
+	info, err := os.Stat(path)
+	if err != nil {
+		return "", false
+	}
+	if time.Since(info.ModTime()) > cacheExpiry {
+		os.Remove(path)
+		return "", false
+	}
+	data, err := os.ReadFile(path)
+	if err != nil {
+		return "", false
+	}
+	return string(data), true
+}
+
+// cachePut stores response under key. The file is written to a temporary name
+// and renamed into place so concurrent readers never see a partial response.
+// Expired entries are pruned from the cache directory on every write, so the
+// cache does not grow without limit.
+func cachePut(dir string, key string, response string) error {
+	if err := os.MkdirAll(dir, 0o700); err != nil {
+		return err
+	}
+	tmp, err := os.CreateTemp(dir, key+".*.tmp")
+	if err != nil {
+		return err
+	}
+	defer os.Remove(tmp.Name())
+
+	if _, err := tmp.WriteString(response); err != nil {
+		tmp.Close()
+		return err
+	}
+	if err := tmp.Close(); err != nil {
+		return err
+	}
+	if err := os.Rename(tmp.Name(), filepath.Join(dir, key)); err != nil {
+		return err
+	}
+	pruneCache(dir)
+	return nil
+}
+
+// pruneCache removes the entries in dir that are older than cacheExpiry.
+// Errors are ignored, a failed removal is retried on the next write.
+func pruneCache(dir string) {
+	entries, err := os.ReadDir(dir)
+	if err != nil {
+		return
+	}
+	for _, entry := range entries {
+		info, err := entry.Info()
+		if err != nil || !info.Mode().IsRegular() {
+			continue
+		}
+		if time.Since(info.ModTime()) > cacheExpiry {
+			os.Remove(filepath.Join(dir, entry.Name()))
+		}
+	}
+}
@@ -0,0 +1,91 @@
+package sqirvy
+
+import (
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+)
+
+func TestCacheKey(t *testing.T) {
+	options := Options{Temperature: 0.5, MaxTokens: 1024}
+	key := cacheKey("openai|", assistant, []string{"hello"}, "gpt-4o", options)
+
+	if key != cacheKey("openai|", assistant, []string{"hello"}, "gpt-4o", options) {
+		t.Error("cacheKey() is not deterministic")
+	}
+
+	// surrounding whitespace and line endings do not change the key
+	if key != cacheKey("openai|", assistant+"\n", []string{"  hello\r\n"}, "gpt-4o", options) {
+		t.Error("cacheKey() changed with surrounding whitespace")
+	}
+
+	tests := []struct {
+		name     string
+		endpoint string
+		system   string
+		prompts  []string
+		model    string
+		options  Options
+	}{
+		{name: "Endpoint", endpoint: "openai|http://localhost:8080/v1", system: assistant, prompts: []string{"hello"}, model: "gpt-4o", options: options},
+		{name: "System", endpoint: "openai|", system: "other", prompts: []string{"hello"}, model: "gpt-4o", options: options},
+		{name: "Prompts", endpoint: "openai|", system: assistant, prompts: []string{"hello", "world"}, model: "gpt-4o", options: options},
+		{name: "Model", endpoint: "openai|", system: assistant, prompts: []string{"hello"}, model: "gpt-4o-mini", options: options},
+		{name: "Temperature", endpoint: "openai|", system: assistant, prompts: []string{"hello"}, model: "gpt-4o", options: Options{Temperature: 1.0, MaxTokens: 1024}},
+	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if cacheKey(tt.endpoint, tt.system, tt.prompts, tt.model, tt.options) == key {
+				t.Errorf("cacheKey() did not change with %s", tt.name)
+			}
+		})
+	}
+}
+
+func TestCachePutGet(t *testing.T) {
+	dir := filepath.Join(t.TempDir(), "sqirvy")
+	key := cacheKey("openai|", assistant, []string{"hello"}, "gpt-4o", Options{})
+
+	if _, ok := cacheGet(dir, key); ok {
+		t.Fatal("cacheGet() hit on an empty cache")
+	}
+
+	if err := cachePut(dir, key, "Hello, World!"); err != nil {
+		t.Fatalf("cachePut() error = %v", err)
+	}
+	got, ok := cacheGet(dir, key)
+	if !ok || got != "Hello, World!" {
+		t.Errorf("cacheGet() = %q, %v, want %q, true", got, ok, "Hello, World!")
+	}
+
+	// an expired entry is a miss
+	old := time.Now().Add(-cacheExpiry - time.Minute)
+	if err := os.Chtimes(filepath.Join(dir, key), old, old); err != nil {
+		t.Fatal(err)
+	}
+	if _, ok := cacheGet(dir, key); ok {
+		t.Error("cacheGet() hit on an expired entry")
+	}
+	if _, err := os.Stat(filepath.Join(dir, key)); !os.IsNotExist(err) {
+		t.Errorf("cacheGet() left the expired entry in place, stat error = %v", err)
+	}
+
+	// writing an entry prunes the expired ones
+	expired := filepath.Join(dir, "expired")
+	if err := os.WriteFile(expired, []byte("old"), 0o600); err != nil {
+		t.Fatal(err)
+	}
+	if err := os.Chtimes(expired, old, old); err != nil {
+		t.Fatal(err)
+	}
+	if err := cachePut(dir, key, "Hello, World!"); err != nil {
+		t.Fatalf("cachePut() error = %v", err)
+	}
+	if _, err := os.Stat(expired); !os.IsNotExist(err) {
+		t.Errorf("cachePut() did not prune the expired entry, stat error = %v", err)
+	}
+	if _, ok := cacheGet(dir, key); !ok {
+		t.Error("cacheGet() missed the entry just written")
+	}
+}
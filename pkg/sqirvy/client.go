@@ -12,9 +12,12 @@ package sqirvy
 
 import (
 	"context"
+	"crypto/sha256"
+	"encoding/hex"
 	"fmt"
 	"os"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/tmc/langchaingo/llms"
@@ -35,7 +38,11 @@ const (
 // This allows for provider-specific configuration while maintaining a unified interface.
 type Options struct {
 	Temperature float32 // Controls the randomness of the output
-	MaxTokens   int64   // Maximum number of tokens in the response
+	MaxTokens   int64   // Maximum number of tokens in the response, the model's limit if <= 0 or above it
+
+	// StreamFunc, if set, receives the response in chunks as they arrive from
+	// the provider. QueryText still returns the complete response.
+	StreamFunc func(ctx context.Context, chunk []byte) error
 }
 
 // Client provides a unified interface for AI operations.
@@ -46,39 +53,117 @@ type Client interface {
 	Close() error
 }
 
-// NewClient creates a new AI client for the specified provider
+// providerFactories maps each supported provider to the constructor for its client.
+// Only the constructor for the requested provider is invoked, so credentials and
+// connection setup for the other providers are never touched.
+var providerFactories = map[string]func() (Client, error){
+	Anthropic: func() (Client, error) { return NewAnthropicClient() },
+	Gemini:    func() (Client, error) { return NewGeminiClient() },
+	OpenAI:    func() (Client, error) { return NewOpenAIClient() },
+	Llama:     func() (Client, error) { return NewLlamaClient() },
+}
+
+// clientCache holds the clients created by NewClient, keyed by clientCacheKey, so that
+// repeated queries in one process reuse the same underlying HTTP connections.
+var (
+	clientCacheMu sync.Mutex
+	clientCache   = map[string]Client{}
+)
+
+// clientCacheKey identifies a client by its provider and the credentials it is
+// created with, so a changed API key or base URL results in a new client.
+// Only a short hash of the API key is kept in the key.
+func clientCacheKey(provider string) string {
+	prefix := strings.ToUpper(provider)
+	sum := sha256.Sum256([]byte(os.Getenv(prefix + "_API_KEY")))
+	return provider + "|" + os.Getenv(prefix+"_BASE_URL") + "|" + hex.EncodeToString(sum[:8])
+}
+
+// ClearClientCache closes and discards all clients cached by NewClient.
+func ClearClientCache() {
+	clientCacheMu.Lock()
+	defer clientCacheMu.Unlock()
+	for _, client := range clientCache {
+		client.Close()
+	}
+	clear(clientCache)
+}
+
+// NewClient creates a new AI client for the specified provider.
+// Provider names are matched case-insensitively.
+//
+// Clients are cached per provider and credentials, so subsequent calls for the
+// same provider return the same client instance until ClearClientCache is called.
+// The cache owns the clients it returns. Callers must not Close them, they are
+// closed by ClearClientCache.
 func NewClient(provider string) (Client, error) {
-	switch provider {
-	case Anthropic:
-		client, err := NewAnthropicClient()
-		if err != nil {
-			return nil, fmt.Errorf("failed to create client for provider %s: %w", provider, err)
-		}
-		return client, nil
-	case Gemini:
-		client, err := NewGeminiClient()
-		if err != nil {
-			return nil, fmt.Errorf("failed to create client for provider %s: %w", provider, err)
-		}
-		return client, nil
-	case OpenAI:
-		client, err := NewOpenAIClient()
-		if err != nil {
-			return nil, fmt.Errorf("failed to create client for provider %s: %w", provider, err)
-		}
-		return client, nil
-	case Llama:
-		client, err := NewLlamaClient()
-		if err != nil {
-			return nil, fmt.Errorf("failed to create client for provider %s: %w", provider, err)
-		}
-		return client, nil
-	default:
+	provider = strings.ToLower(provider)
+	factory, ok := providerFactories[provider]
+	if !ok {
 		return nil, fmt.Errorf("unsupported provider: %s", provider)
 	}
+
+	clientCacheMu.Lock()
+	defer clientCacheMu.Unlock()
+
+	key := clientCacheKey(provider)
+	if client, ok := clientCache[key]; ok {
+		return client, nil
+	}
+
+	// constructor errors already name the provider, callers add their own context
+	client, err := factory()
+	if err != nil {
+		return nil, err
+	}
+	clientCache[key] = client
+	return client, nil
+}
+
+// langchainClient implements the Client interface on top of a langchaingo model.
+// The provider clients embed it and only differ in how the llm is constructed.
+type langchainClient struct {
+	llm              llms.Model // langchaingo LLM client
+	provider         string     // provider whose models this client accepts
+	name             string     // provider display name used in errors
+	temperatureScale float32
+}
+
+// QueryText sends a text query to the specified model using langchaingo and returns the response.
+//
+// It takes a context, system prompt, a list of prompts, the model name, and options as input.
+// It returns the generated text or an error if the query fails or the model does not
+// belong to the client's provider.
+// Request timeouts are handled by the input context.
+func (c *langchainClient) QueryText(ctx context.Context, system string, prompts []string, model string, options Options) (string, error) {
+	// validate the model, the same lookup provides its token limit and
+	// resolves an alias to the canonical name the provider accepts
+	entry, ok := modelLookup[model]
+	if !ok || entry.Provider != c.provider {
+		return "", fmt.Errorf("invalid or unsupported %s model: %s", c.name, model)
+	}
+	model = entry.Name
+
+	// scale the temperature
+	options.Temperature = options.Temperature * c.temperatureScale
+	// use the caller's token limit when it is set and within the model's limit
+	if options.MaxTokens <= 0 || options.MaxTokens > entry.MaxTokens {
+		options.MaxTokens = entry.MaxTokens
+	}
+
+	return queryTextLangChain(ctx, c.llm, c.provider, system, prompts, model, options)
 }
 
-func queryTextLangChain(ctx context.Context, llm llms.Model, system string, prompts []string, model string, options Options) (string, error) {
+// Close implements the Close method for the Client interface.
+//
+// This method does not require any action as the underlying langchaingo
+// client does not need to be explicitly closed.
+func (c *langchainClient) Close() error {
+	// the langchaingo llm does not require explicit close
+	return nil
+}
+
+func queryTextLangChain(ctx context.Context, llm llms.Model, provider string, system string, prompts []string, model string, options Options) (string, error) {
 	if ctx.Err() != nil {
 		return "", fmt.Errorf("request context error %w", ctx.Err())
 	}
@@ -87,23 +172,44 @@ func queryTextLangChain(ctx context.Context, llm llms.Model, system string, prom
 		return "", fmt.Errorf("prompts cannot be empty for text query")
 	}
 
-	// system prompt
-	content := []llms.MessageContent{
-		llms.TextParts(llms.ChatMessageTypeSystem, system),
+	// answer from the response cache when it is enabled and holds this request
+	var cacheDir, key string
+	if cacheEnabled() {
+		if dir, err := responseCacheDir(); err == nil {
+			cacheDir = dir
+			key = cacheKey(cacheEndpoint(provider), system, prompts, model, options)
+			if response, ok := cacheGet(cacheDir, key); ok {
+				if options.StreamFunc != nil {
+					if err := options.StreamFunc(ctx, []byte(response)); err != nil {
+						return "", fmt.Errorf("failed to stream cached response: %w", err)
+					}
+				}
+				return response, nil
+			}
+		}
 	}
 
-	// query prompts
+	// system prompt followed by the query prompts, allocated once at its final size.
+	// An empty system prompt is left out rather than sent as an empty message.
+	content := make([]llms.MessageContent, 0, len(prompts)+1)
+	if system != "" {
+		content = append(content, llms.TextParts(llms.ChatMessageTypeSystem, system))
+	}
 	for _, prompt := range prompts {
 		content = append(content, llms.TextParts(llms.ChatMessageTypeHuman, prompt))
 	}
 
-	// generate completion
-	completion, err := llm.GenerateContent(
-		ctx, content,
+	callOptions := []llms.CallOption{
 		llms.WithTemperature(float64(options.Temperature)),
 		llms.WithModel(model),
 		llms.WithMaxTokens(int(options.MaxTokens)),
-	)
+	}
+	if options.StreamFunc != nil {
+		callOptions = append(callOptions, llms.WithStreamingFunc(options.StreamFunc))
+	}
+
+	// generate completion
+	completion, err := llm.GenerateContent(ctx, content, callOptions...)
 	if err != nil {
 		return "", fmt.Errorf("failed to generate completion: %w", err)
 	}
@@ -116,5 +222,10 @@ func queryTextLangChain(ctx context.Context, llm llms.Model, system string, prom
 		response.WriteString(part.Content)
 	}
 
+	// the cache is best effort, a failed write does not fail the query
+	if key != "" {
+		_ = cachePut(cacheDir, key, response.String())
+	}
+
 	return response.String(), nil
 }
@@ -0,0 +1,307 @@
+package sqirvy
+
+import (
+	"context"
+	"errors"
+	"os"
+	"strings"
+	"testing"
+
+	"github.com/tmc/langchaingo/llms"
+)
+
+const assistant = "you are a helpful assistant"
+
+func TestNewClient_Provider(t *testing.T) {
+	tests := []struct {
+		name        string
+		provider    string
+		unsupported bool
+	}{
+		{name: "Lowercase provider", provider: "gemini", unsupported: false},
+		{name: "Mixed case provider", provider: "OpenAI", unsupported: false},
+		{name: "Unknown provider", provider: "unknown", unsupported: true},
+		{name: "Empty provider", provider: "", unsupported: true},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			// supported providers may still fail if their API key is not set,
+			// but they must never be reported as unsupported
+			_, err := NewClient(tt.provider)
+			gotUnsupported := err != nil && strings.Contains(err.Error(), "unsupported provider")
+			if gotUnsupported != tt.unsupported {
+				t.Errorf("NewClient(%q) error = %v, want unsupported %v", tt.provider, err, tt.unsupported)
+			}
+		})
+	}
+}
+
+// fakeClient is a Client that records whether it was closed
+type fakeClient struct {
+	closed int
+}
+
+func (c *fakeClient) QueryText(ctx context.Context, system string, prompts []string, model string, options Options) (string, error) {
+	return "", nil
+}
+
+func (c *fakeClient) Close() error {
+	c.closed++
+	return nil
+}
+
+// fakeLLM is an llms.Model that answers every request with response and
+// records the model it was asked for
+type fakeLLM struct {
+	response  string
+	calls     int
+	model     string
+	maxTokens int
+}
+
+func (f *fakeLLM) GenerateContent(ctx context.Context, messages []llms.MessageContent, options ...llms.CallOption) (*llms.ContentResponse, error) {
+	opts := llms.CallOptions{}
+	for _, opt := range options {
+		opt(&opts)
+	}
+	f.calls++
+	f.model = opts.Model
+	f.maxTokens = opts.MaxTokens
+	if opts.StreamingFunc != nil {
+		// stream the response in two chunks
+		half := len(f.response) / 2
+		for _, chunk := range []string{f.response[:half], f.response[half:]} {
+			if err := opts.StreamingFunc(ctx, []byte(chunk)); err != nil {
+				return nil, err
+			}
+		}
+	}
+	return &llms.ContentResponse{Choices: []*llms.ContentChoice{{Content: f.response}}}, nil
+}
+
+func (f *fakeLLM) Call(ctx context.Context, prompt string, options ...llms.CallOption) (string, error) {
+	return f.response, nil
+}
+
+func TestLangchainClient_QueryTextAlias(t *testing.T) {
+	// cache responses in a temporary directory
+	t.Setenv(cacheEnvVar, "1")
+	t.Setenv("XDG_CACHE_HOME", t.TempDir())
+	t.Setenv("HOME", t.TempDir())
+
+	llm := &fakeLLM{response: "Hello, World!"}
+	client := &langchainClient{llm: llm, provider: Anthropic, name: "Anthropic", temperatureScale: 1.0}
+
+	got, err := client.QueryText(context.Background(), assistant, []string{"hello"}, "claude-3-7-sonnet", Options{})
+	if err != nil {
+		t.Fatalf("QueryText() error = %v", err)
+	}
+	if got != llm.response {
+		t.Errorf("QueryText() = %q, want %q", got, llm.response)
+	}
+	// the provider is sent the canonical model name, not the alias
+	if llm.model != "claude-3-7-sonnet-latest" {
+		t.Errorf("QueryText() sent model %q, want %q", llm.model, "claude-3-7-sonnet-latest")
+	}
+
+	// the alias and its target share a cache entry
+	if _, err := client.QueryText(context.Background(), assistant, []string{"hello"}, "claude-3-7-sonnet-latest", Options{}); err != nil {
+		t.Fatalf("QueryText() error = %v", err)
+	}
+	if llm.calls != 1 {
+		t.Errorf("QueryText() called the provider %d times, want 1", llm.calls)
+	}
+
+	// models of another provider are still rejected
+	if _, err := client.QueryText(context.Background(), assistant, []string{"hello"}, "gpt-4o", Options{}); err == nil {
+		t.Error("QueryText() error = nil for a model of another provider")
+	}
+}
+
+func TestLangchainClient_QueryTextMaxTokens(t *testing.T) {
+	// disable the response cache, cases with the same limit would share an entry
+	t.Setenv(cacheEnvVar, "")
+
+	tests := []struct {
+		name      string
+		maxTokens int64
+		want      int
+	}{
+		{name: "Not set", maxTokens: 0, want: 64000},
+		{name: "Within the model limit", maxTokens: 1024, want: 1024},
+		{name: "Above the model limit", maxTokens: 100000, want: 64000},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			llm := &fakeLLM{response: "Hello, World!"}
+			client := &langchainClient{llm: llm, provider: Anthropic, name: "Anthropic", temperatureScale: 1.0}
+			if _, err := client.QueryText(context.Background(), assistant, []string{"hello"}, "claude-3-7-sonnet-latest", Options{MaxTokens: tt.maxTokens}); err != nil {
+				t.Fatalf("QueryText() error = %v", err)
+			}
+			if llm.maxTokens != tt.want {
+				t.Errorf("QueryText() sent max tokens %d, want %d", llm.maxTokens, tt.want)
+			}
+		})
+	}
+}
+
+func TestLangchainClient_QueryTextStream(t *testing.T) {
+	t.Setenv(cacheEnvVar, "1")
+	t.Setenv("XDG_CACHE_HOME", t.TempDir())
+	t.Setenv("HOME", t.TempDir())
+
+	llm := &fakeLLM{response: "Hello, World!"}
+	client := &langchainClient{llm: llm, provider: Anthropic, name: "Anthropic", temperatureScale: 1.0}
+
+	var chunks []string
+	options := Options{StreamFunc: func(ctx context.Context, chunk []byte) error {
+		chunks = append(chunks, string(chunk))
+		return nil
+	}}
+
+	// the provider's chunks are passed to StreamFunc as they arrive
+	got, err := client.QueryText(context.Background(), assistant, []string{"hello"}, "claude-3-7-sonnet-latest", options)
+	if err != nil {
+		t.Fatalf("QueryText() error = %v", err)
+	}
+	if got != llm.response || strings.Join(chunks, "") != llm.response || len(chunks) != 2 {
+		t.Errorf("QueryText() = %q, streamed %q, want %q in 2 chunks", got, chunks, llm.response)
+	}
+
+	// a cached response is streamed in one chunk without calling the provider
+	chunks = nil
+	got, err = client.QueryText(context.Background(), assistant, []string{"hello"}, "claude-3-7-sonnet-latest", options)
+	if err != nil {
+		t.Fatalf("QueryText() error = %v", err)
+	}
+	if llm.calls != 1 {
+		t.Errorf("QueryText() called the provider %d times, want 1", llm.calls)
+	}
+	if got != llm.response || len(chunks) != 1 || chunks[0] != llm.response {
+		t.Errorf("QueryText() = %q, streamed %q, want %q in 1 chunk", got, chunks, llm.response)
+	}
+
+	// a StreamFunc error fails the query
+	options.StreamFunc = func(ctx context.Context, chunk []byte) error {
+		return errors.New("stream closed")
+	}
+	if _, err := client.QueryText(context.Background(), assistant, []string{"hello"}, "claude-3-7-sonnet-latest", options); err == nil {
+		t.Error("QueryText() error = nil when StreamFunc fails")
+	}
+}
+
+func TestNewClient_Cache(t *testing.T) {
+	// register a fake provider so no real client is constructed
+	created := 0
+	providerFactories["fake"] = func() (Client, error) {
+		created++
+		return &fakeClient{}, nil
+	}
+	t.Cleanup(func() {
+		ClearClientCache()
+		delete(providerFactories, "fake")
+	})
+	t.Setenv("FAKE_API_KEY", "key-1")
+	t.Setenv("FAKE_BASE_URL", "https://one.example")
+	ClearClientCache()
+
+	first, err := NewClient("fake")
+	if err != nil {
+		t.Fatalf("NewClient() error = %v", err)
+	}
+	if again, _ := NewClient("FAKE"); again != first || created != 1 {
+		t.Errorf("NewClient() did not return the cached client, created %d clients", created)
+	}
+
+	// a changed API key or base URL creates a new client
+	t.Setenv("FAKE_API_KEY", "key-2")
+	if client, _ := NewClient("fake"); client == first || created != 2 {
+		t.Errorf("NewClient() reused the client after the API key changed, created %d clients", created)
+	}
+	t.Setenv("FAKE_BASE_URL", "https://two.example")
+	if client, _ := NewClient("fake"); client == first || created != 3 {
+		t.Errorf("NewClient() reused the client after the base URL changed, created %d clients", created)
+	}
+
+	// ClearClientCache closes the cached clients and drops them
+	ClearClientCache()
+	if closed := first.(*fakeClient).closed; closed != 1 {
+		t.Errorf("ClearClientCache() closed the client %d times, want 1", closed)
+	}
+	t.Setenv("FAKE_API_KEY", "key-1")
+	t.Setenv("FAKE_BASE_URL", "https://one.example")
+	if client, _ := NewClient("fake"); client == first || created != 4 {
+		t.Errorf("NewClient() returned a cleared client, created %d clients", created)
+	}
+}
+
+func TestClient_QueryText(t *testing.T) {
+	// live queries neither read from nor write to the user's response cache
+	t.Setenv(cacheEnvVar, "")
+
+	// one entry per provider, each is skipped if its environment is not set
+	providers := []struct {
+		provider string
+		model    string
+		env      []string
+		options  Options
+	}{
+		{provider: "anthropic", model: "claude-3-haiku-20240307", env: []string{"ANTHROPIC_API_KEY"}, options: Options{MaxTokens: GetMaxTokens("claude-3-haiku-20240307"), Temperature: 0.5}},
+		{provider: "gemini", model: "gemini-1.5-flash", env: []string{"GEMINI_API_KEY"}, options: Options{Temperature: 0.5, MaxTokens: 4096}},
+		{provider: "openai", model: "gpt-4o", env: []string{"OPENAI_API_KEY"}, options: Options{MaxTokens: GetMaxTokens("gpt-4-turbo")}},
+		{provider: "llama", model: "llama3.3-70b", env: []string{"LLAMA_API_KEY", "LLAMA_BASE_URL"}, options: Options{}},
+	}
+
+	tests := []struct {
+		name    string
+		prompt  []string
+		wantErr bool
+	}{
+		{
+			name:    "Basic prompt",
+			prompt:  []string{"Say 'Hello, World!'"},
+			wantErr: false,
+		},
+		{
+			name:    "Empty prompt",
+			prompt:  []string{},
+			wantErr: true,
+		},
+	}
+
+	for _, p := range providers {
+		t.Run(p.provider, func(t *testing.T) {
+			for _, env := range p.env {
+				if os.Getenv(env) == "" {
+					t.Skip(env + " not set")
+				}
+			}
+
+			client, err := NewClient(p.provider)
+			if err != nil {
+				t.Fatalf("new client failed: %v", err)
+			}
+
+			for _, tt := range tests {
+				t.Run(tt.name, func(t *testing.T) {
+					got, err := client.QueryText(context.Background(), assistant, tt.prompt, p.model, p.options)
+					if tt.wantErr {
+						if err == nil {
+							t.Errorf("QueryText() error = nil, wantErr %v", tt.wantErr)
+						}
+						return
+					}
+					if err != nil {
+						t.Errorf("QueryText() error = %v", err)
+						return
+					}
+					if len(got) == 0 {
+						t.Error("QueryText() returned empty response")
+					}
+				})
+			}
+		})
+	}
+}
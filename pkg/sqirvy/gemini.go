@@ -10,7 +10,6 @@ import (
 	"fmt"
 	"os"
 
-	"github.com/tmc/langchaingo/llms"
 	"github.com/tmc/langchaingo/llms/googleai"
 )
 
@@ -20,8 +19,7 @@ const gemini_temperature_scale = 2.0
 // It provides methods for querying Google's Gemini language models through
 // the langchaingo library.
 type GeminiClient struct {
-	llm              llms.Model // langchaingo LLM client
-	temperatureScale float32
+	langchainClient
 }
 
 // Ensure GeminiClient implements the Client interface
@@ -47,33 +45,10 @@ func NewGeminiClient() (*GeminiClient, error) {
 		return nil, fmt.Errorf("failed to create Gemini client: %w", err)
 	}
 
-	return &GeminiClient{
+	return &GeminiClient{langchainClient{
 		llm:              llm,
-		temperatureScale: gemini_temperature_scale, // Default temperature scale for Gemini
-	}, nil
-}
-
-// QueryText sends a text query to the specified Gemini model using langchaingo and returns the response.
-//
-// It takes a context, system prompt, a list of prompts, the model name, and options as input.
-// It returns the generated text or an error if the query fails.
-// Request timeouts are handled by the input context.
-func (c *GeminiClient) QueryText(ctx context.Context, system string, prompts []string, model string, options Options) (string, error) {
-
-	provider, err := GetProviderName(model)
-	if err != nil || provider != Gemini {
-		return "", fmt.Errorf("invalid or unsupported Gemini model: %s", model)
-	}
-	options.Temperature = options.Temperature * c.temperatureScale
-	options.MaxTokens = GetMaxTokens(model)
-	return queryTextLangChain(ctx, c.llm, system, prompts, model, options)
-}
-
-// Close implements the Close method for the Client interface.
-//
-// For the Gemini client, this method does not require any action as the
-// underlying langchaingo client does not need to be explicitly closed.
-func (c *GeminiClient) Close() error {
-	// the langchaingo llm does not require explicit close
-	return nil
+		provider:         Gemini,
+		name:             "Gemini",
+		temperatureScale: gemini_temperature_scale,
+	}}, nil
 }
@@ -6,11 +6,9 @@
 package sqirvy
 
 import (
-	"context"
 	"fmt"
 	"os"
 
-	"github.com/tmc/langchaingo/llms"
 	"github.com/tmc/langchaingo/llms/openai"
 )
 
@@ -20,8 +18,7 @@ const llama_temperature_scale = 1.0
 // It provides methods for querying Llama language models through
 // an OpenAI-compatible interface.
 type LlamaClient struct {
-	llm              llms.Model // OpenAI-compatible LLM client
-	temperatureScale float32
+	langchainClient
 }
 
 // Ensure LlamaClient implements the Client interface
@@ -50,38 +47,16 @@ func NewLlamaClient() (*LlamaClient, error) {
 	llm, err := openai.New(
 		openai.WithBaseURL(baseURL),
 		openai.WithToken(apiKey),
+		openai.WithHTTPClient(openaiHTTPClient),
 	)
 	if err != nil {
 		return nil, fmt.Errorf("failed to create Llama client: %w", err)
 	}
 
-	return &LlamaClient{
+	return &LlamaClient{langchainClient{
 		llm:              llm,
-		temperatureScale: llama_temperature_scale, // Default temperature scale for Llama
-	}, nil
-}
-
-// QueryText implements the Client interface method for querying Llama models.
-// It sends a text query to Meta's Llama models and returns the generated text response.
-// Request timeouts are handled by the input context.
-func (c *LlamaClient) QueryText(ctx context.Context, system string, prompts []string, model string, options Options) (string, error) {
-	provider, err := GetProviderName(model)
-	if err != nil || provider != Llama {
-		return "", fmt.Errorf("invalid or unsupported Llama model: %s", model)
-	}
-
-	// scale the temperature
-	options.Temperature = options.Temperature * c.temperatureScale
-	options.MaxTokens = GetMaxTokens(model)
-
-	return queryTextLangChain(ctx, c.llm, system, prompts, model, options)
-}
-
-// Close implements the Close method for the Client interface.
-//
-// For the Llama client, this method does not require any action as the
-// underlying langchaingo client does not need to be explicitly closed.
-func (c *LlamaClient) Close() error {
-	// the langchain llm does not require explicit close
-	return nil
+		provider:         Llama,
+		name:             "Llama",
+		temperatureScale: llama_temperature_scale,
+	}}, nil
 }
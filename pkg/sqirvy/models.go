@@ -57,18 +57,28 @@ var modelRegistry = map[string]ModelInfo{
 	"llama3.3-70b": {Provider: Llama, MaxTokens: MAX_TOKENS_DEFAULT},
 }
 
-// ModelToMaxTokens maps model names to their maximum token limits.
-// If a model is not in this map, MAX_TOKENS_DEFAULT will be used.
-// MAX_TOKENS_DEFAULT is defined in client.go
-// This map is maintained for backward compatibility
-var modelToMaxTokens = map[string]int64{}
+// modelEntry is the information modelLookup holds for a model name or alias,
+// including the canonical model name that is sent to the provider.
+type modelEntry struct {
+	Name string
+	ModelInfo
+}
 
-// Initialize modelToMaxTokens from modelRegistry for backward compatibility
-func init() {
+// modelLookup resolves model names and their aliases to model information with
+// a single map lookup. It is built once from modelRegistry and modelAlias; aliases
+// whose target is not in modelRegistry are left out.
+var modelLookup = func() map[string]modelEntry {
+	lookup := make(map[string]modelEntry, len(modelRegistry)+len(modelAlias))
 	for model, info := range modelRegistry {
-		modelToMaxTokens[model] = info.MaxTokens
+		lookup[model] = modelEntry{Name: model, ModelInfo: info}
 	}
-}
+	for alias, model := range modelAlias {
+		if info, ok := modelRegistry[model]; ok {
+			lookup[alias] = modelEntry{Name: model, ModelInfo: info}
+		}
+	}
+	return lookup
+}()
 
 // GetModelAlias returns the standardized model name for a given alias.
 // This is used in cmd/sqirvy-cli to validate the model command line argument
@@ -102,27 +112,27 @@ func GetModelProviderList() []ModelProvider {
 	return mp
 }
 
-// GetProviderName returns the provider name for a given model identifier.
+// GetProviderName returns the provider name for a given model identifier or alias.
 // Returns an error if the model is not recognized.
 func GetProviderName(model string) (string, error) {
-	if info, ok := modelRegistry[model]; ok {
+	if info, ok := modelLookup[model]; ok {
 		return info.Provider, nil
 	}
 	return "", fmt.Errorf("unrecognized model: %s", model)
 }
 
 // GetMaxTokensWithError returns the maximum token limit for a given model identifier
-// along with an error if the model is not recognized.
+// or alias along with an error if the model is not recognized.
 // This function provides more detailed error reporting compared to GetMaxTokens.
 func GetMaxTokensWithError(model string) (int64, error) {
-	if info, ok := modelRegistry[model]; ok {
+	if info, ok := modelLookup[model]; ok {
 		return info.MaxTokens, nil
 	}
 	return MAX_TOKENS_DEFAULT, fmt.Errorf("unrecognized model: %s, using default token limit", model)
 }
 
 // GetMaxTokens returns the maximum token limit for a given model identifier.
-// Returns MAX_TOKENS_DEFAULT if the model is not in ModelToMaxTokens.
+// Returns MAX_TOKENS_DEFAULT if the model is not in modelRegistry.
 // This function maintains backward compatibility with existing code.
 func GetMaxTokens(model string) int64 {
 	tokens, _ := GetMaxTokensWithError(model)
@@ -3,10 +3,14 @@ package sqirvy
 import (
 	"context"
 	"os"
+	"strings"
 	"testing"
 )
 
 func TestAllModels(t *testing.T) {
+	// live queries neither read from nor write to the user's response cache
+	t.Setenv(cacheEnvVar, "")
+
 	// Test cases for both QueryText and QueryJSON
 	tests := []struct {
 		name    string
@@ -33,6 +37,13 @@ func TestAllModels(t *testing.T) {
 	// Test each model from modelRegistry
 	for model, info := range modelRegistry {
 		provider := info.Provider
+
+		// Check if required API key is set before creating a client
+		if os.Getenv(strings.ToUpper(provider)+"_API_KEY") == "" {
+			t.Logf("Skipping tests for %s model %s: API key not set", provider, model)
+			continue
+		}
+
 		// Create client for this provider
 		client, err := NewClient(provider)
 		if err != nil {
@@ -40,24 +51,6 @@ func TestAllModels(t *testing.T) {
 			continue
 		}
 
-		// Check if required API key is set
-		var apiKey string
-		switch provider {
-		case "anthropic":
-			apiKey = os.Getenv("ANTHROPIC_API_KEY")
-		case "gemini":
-			apiKey = os.Getenv("GEMINI_API_KEY")
-		case "openai":
-			apiKey = os.Getenv("OPENAI_API_KEY")
-		case "llama":
-			apiKey = os.Getenv("LLAMA_API_KEY")
-		}
-
-		if apiKey == "" {
-			t.Logf("Skipping tests for %s model %s: API key not set", provider, model)
-			continue
-		}
-
 		// Test QueryText
 		t.Run(model+"_QueryText", func(t *testing.T) {
 			for _, tt := range tests {
@@ -83,3 +76,40 @@ func TestAllModels(t *testing.T) {
 		})
 	}
 }
+
+func TestGetProviderName(t *testing.T) {
+	tests := []struct {
+		name      string
+		model     string
+		provider  string
+		maxTokens int64
+		wantErr   bool
+	}{
+		{name: "Model name", model: "claude-3-7-sonnet-latest", provider: Anthropic, maxTokens: 64000},
+		{name: "Model alias", model: "claude-3-7-sonnet", provider: Anthropic, maxTokens: 64000},
+		{name: "Alias without registered model", model: "claude-3-opus", wantErr: true},
+		{name: "Unknown model", model: "no-such-model", wantErr: true},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			provider, err := GetProviderName(tt.model)
+			maxTokens, tokErr := GetMaxTokensWithError(tt.model)
+			if tt.wantErr {
+				if err == nil || tokErr == nil {
+					t.Errorf("GetProviderName(%q) error = %v, GetMaxTokensWithError error = %v, want errors", tt.model, err, tokErr)
+				}
+				return
+			}
+			if err != nil || tokErr != nil {
+				t.Fatalf("GetProviderName(%q) error = %v, GetMaxTokensWithError error = %v", tt.model, err, tokErr)
+			}
+			if provider != tt.provider {
+				t.Errorf("GetProviderName(%q) = %v, want %v", tt.model, provider, tt.provider)
+			}
+			if maxTokens != tt.maxTokens {
+				t.Errorf("GetMaxTokensWithError(%q) = %v, want %v", tt.model, maxTokens, tt.maxTokens)
+			}
+		})
+	}
+}
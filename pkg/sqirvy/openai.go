@@ -6,22 +6,36 @@
 package sqirvy
 
 import (
-	"context"
 	"fmt"
+	"net/http"
 	"os"
+	"time"
 
-	"github.com/tmc/langchaingo/llms"
 	"github.com/tmc/langchaingo/llms/openai"
 )
 
 const openai_temperature_scale = 2.0
 
+// openaiHTTPClient is shared by the OpenAI-compatible clients (OpenAI and Llama).
+// Its transport keeps idle connections open so that subsequent requests to the
+// same endpoint reuse the TCP and TLS session instead of handshaking again.
+var openaiHTTPClient = &http.Client{Transport: newPooledTransport()}
+
+// newPooledTransport returns a copy of the default transport with a larger
+// keep-alive pool per host.
+func newPooledTransport() *http.Transport {
+	transport := http.DefaultTransport.(*http.Transport).Clone()
+	transport.MaxIdleConns = 100
+	transport.MaxIdleConnsPerHost = 20
+	transport.IdleConnTimeout = 30 * time.Second
+	return transport
+}
+
 // OpenAIClient implements the Client interface for OpenAI models.
 // It provides methods for querying OpenAI language models through
 // an OpenAI-compatible interface.
 type OpenAIClient struct {
-	llm              llms.Model // OpenAI-compatible LLM client
-	temperatureScale float32
+	langchainClient
 }
 
 // Ensure OpenAIClient implements the Client interface
@@ -50,39 +64,16 @@ func NewOpenAIClient() (*OpenAIClient, error) {
 	llm, err := openai.New(
 		openai.WithBaseURL(baseURL),
 		openai.WithToken(apiKey),
+		openai.WithHTTPClient(openaiHTTPClient),
 	)
 	if err != nil {
 		return nil, fmt.Errorf("failed to create OpenAI client: %w", err)
 	}
 
-	return &OpenAIClient{
+	return &OpenAIClient{langchainClient{
 		llm:              llm,
-		temperatureScale: openai_temperature_scale, // Default temperature scale for OpenAI
-	}, nil
-}
-
-// QueryText implements the Client interface method for querying OpenAI models.
-// It sends a text query to OpenAI models and returns the generated text response.
-// It returns an error if the query fails or the model is invalid.
-func (c *OpenAIClient) QueryText(ctx context.Context, system string, prompts []string, model string, options Options) (string, error) {
-	// validate the model
-	provider, err := GetProviderName(model)
-	if err != nil || provider != OpenAI {
-		return "", fmt.Errorf("invalid or unsupported OpenAI model: %s", model)
-	}
-
-	// scale the temperature
-	options.Temperature = options.Temperature * c.temperatureScale
-	options.MaxTokens = GetMaxTokens(model)
-
-	return queryTextLangChain(ctx, c.llm, system, prompts, model, options)
-}
-
-// Close implements the Close method for the Client interface.
-//
-// For the OpenAI client, this method does not require any action as the
-// underlying langchaingo client does not need to be explicitly closed.
-func (c *OpenAIClient) Close() error {
-	// the langchain llm does not require explicit close
-	return nil
+		provider:         OpenAI,
+		name:             "OpenAI",
+		temperatureScale: openai_temperature_scale,
+	}}, nil
 }
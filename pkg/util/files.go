@@ -1,12 +1,13 @@
 package util
 
 import (
-	"bufio"
 	"fmt"
 	"io"
 	"os"
 	"path/filepath"
 	"strings"
+	"sync"
+	"sync/atomic"
 )
 
 // inputIsFromPipe determines if the program is receiving piped input on stdin.
@@ -32,7 +33,9 @@ func ReadStdin(maxTotalBytes int64) (data string, size int64, err error) {
 		return "", 0, nil
 	}
 
-	stdinBytes, err := io.ReadAll(os.Stdin)
+	// read at most one byte past the limit so oversized input is detected
+	// without first buffering all of it
+	stdinBytes, err := io.ReadAll(io.LimitReader(os.Stdin, maxTotalBytes+1))
 	if err != nil {
 		return "", 0, fmt.Errorf("error reading from stdin: %w", err)
 	}
@@ -57,89 +60,177 @@ func validateFilePath(fname string) (string, error) {
 	return cleanPath, nil
 }
 
+// readBudget tracks how many bytes may still be read by reads that share one
+// size limit. Each read reserves its bytes before reading them, so once the limit
+// is exceeded no further data is buffered by any of the reads.
+type readBudget struct {
+	limit     int64
+	remaining atomic.Int64
+}
+
+func newReadBudget(limit int64) *readBudget {
+	b := &readBudget{limit: limit}
+	b.remaining.Store(limit)
+	return b
+}
+
+// reserve takes n bytes from the budget, returning an error if that exceeds the limit
+func (b *readBudget) reserve(n int64) error {
+	if b.remaining.Add(-n) < 0 {
+		return b.err()
+	}
+	return nil
+}
+
+// exceeded reports whether a reservation has already gone over the limit
+func (b *readBudget) exceeded() bool {
+	return b.remaining.Load() < 0
+}
+
+func (b *readBudget) err() error {
+	return fmt.Errorf("total size would exceed limit of %d bytes", b.limit)
+}
+
 // readFile reads and concatenates the contents of the given files,
 // returning an error if any file doesn't exist, is suspicious or if total size exceeds maxTotalBytes
 func ReadFile(fname string, maxTotalBytes int64) ([]byte, int64, error) {
+	return readFile(fname, newReadBudget(maxTotalBytes))
+}
+
+// readFile reads a single file, reserving its size from budget before reading it.
+// It stops early if another read sharing the budget has exceeded the limit.
+func readFile(fname string, budget *readBudget) ([]byte, int64, error) {
 	// Sanitize path
 	cleanPath, err := validateFilePath(fname)
 	if err != nil {
 		return nil, 0, err
 	}
 
-	// Check if file exists
-	info, err := os.Stat(cleanPath)
+	// path is valid, open the file
+	file, err := os.Open(cleanPath)
 	if err != nil {
 		if os.IsNotExist(err) {
 			return nil, 0, fmt.Errorf("file does not exist: %s", fname)
 		}
-		return nil, 0, fmt.Errorf("error accessing file %s: %v", fname, err)
+		return nil, 0, fmt.Errorf("error opening file %s: %w", fname, err)
 	}
+	defer file.Close()
 
-	// Check if new file would exceed size limit
-	if info.Size() > maxTotalBytes {
-		return nil, 0, fmt.Errorf("total size would exceed limit of %d bytes", maxTotalBytes)
+	// Stat the open file rather than the path, which saves a path lookup
+	// and checks the same file that is read
+	info, err := file.Stat()
+	if err != nil {
+		return nil, 0, fmt.Errorf("error accessing file %s: %v", fname, err)
 	}
 
-	// path is valid, open the file
-	file, err := os.Open(cleanPath)
-	if err != nil {
-		return nil, 0, fmt.Errorf("error opening file %s: %w", fname, err)
+	// Check if new file would exceed size limit
+	reserved := info.Size()
+	if err := budget.reserve(reserved); err != nil {
+		return nil, 0, err
 	}
-	defer file.Close()
 
-	// Read file in chunks
-	rdr := bufio.NewReader(file)
-	buf := make([]byte, 1024)
-	content := make([]byte, 0, maxTotalBytes)
-	var size int64 = 0
+	// Read the whole file into a buffer sized from the file info. The extra
+	// byte of capacity lets the final read report EOF without growing the buffer.
+	content := make([]byte, 0, reserved+1)
 	for {
-		// Read chunk from file
-		n, err := rdr.Read(buf)
+		if budget.exceeded() {
+			return nil, 0, budget.err()
+		}
+		n, err := file.Read(content[len(content):cap(content)])
+		content = content[:len(content)+n]
+		if extra := int64(len(content)) - reserved; extra > 0 {
+			// the file grew after it was checked, reserve the extra bytes
+			reserved += extra
+			if err := budget.reserve(extra); err != nil {
+				return nil, 0, err
+			}
+		}
 		if err != nil {
 			if err == io.EOF {
 				break
 			}
 			return nil, 0, fmt.Errorf("error reading file %s: %w", fname, err)
 		}
-		size += int64(n)
-		if size > maxTotalBytes {
-			return nil, 0, fmt.Errorf("total size would exceed limit of %d bytes", maxTotalBytes)
+		if len(content) == cap(content) {
+			// the file grew after it was checked, make room for more
+			content = append(content, 0)[:len(content)]
 		}
-		// Append chunk to buffer
-		content = append(content, buf[:n]...)
 	}
 
 	return content, int64(len(content)), nil
 }
 
+// maxConcurrentReads limits the number of files ReadFiles reads at the same time
+const maxConcurrentReads = 16
+
+// codeFence opens and closes each file's content in the ReadFiles output
+const codeFence = "```"
+
 // readFiles reads and concatenates the contents of the given files,
 // returning an error if any file doesn't exist, is suspicious or if total size exceeds MaxTotalBytes
+//
+// The files are read concurrently and concatenated in the order given.
 func ReadFiles(filenames []string, maxTotalBytes int64) (string, int64, error) {
 	// Check if we have any files
 	if len(filenames) == 0 {
 		return "", 0, nil
 	}
 
+	// Read the files concurrently, each result is stored at its input index.
+	// The reads share one size budget, so the data buffered across all of them
+	// never exceeds maxTotalBytes, and reads are skipped once it is exceeded.
+	budget := newReadBudget(maxTotalBytes)
+	type result struct {
+		data []byte
+		size int64
+		err  error
+	}
+	results := make([]result, len(filenames))
+	sem := make(chan struct{}, maxConcurrentReads)
+	var wg sync.WaitGroup
+	for i, fname := range filenames {
+		wg.Add(1)
+		go func(i int, fname string) {
+			defer wg.Done()
+			sem <- struct{}{}
+			defer func() { <-sem }()
+			if budget.exceeded() {
+				results[i] = result{err: budget.err()}
+				return
+			}
+			data, size, err := readFile(fname, budget)
+			results[i] = result{data: data, size: size, err: err}
+		}(i, fname)
+	}
+	wg.Wait()
+
+	// The size limit applies to the files together, so exceeding it is reported
+	// once rather than against whichever file happened to be skipped
+	if budget.exceeded() {
+		return "", 0, budget.err()
+	}
+
+	// Check the results in order before copying anything, so the output can be
+	// allocated once at its final size
 	var totalSize int64
-	builder := strings.Builder{}
-	for _, fname := range filenames {
-		start := []byte(fmt.Sprintf("```%s", fname))
-		builder.Write(start)
-		// Read file
-		s, size, err := ReadFile(fname, maxTotalBytes)
-		if err != nil {
-			return "", size, fmt.Errorf("error reading file %s: %w", fname, err)
+	outputSize := 0
+	for i, fname := range filenames {
+		if err := results[i].err; err != nil {
+			return "", results[i].size, fmt.Errorf("error reading file %s: %w", fname, err)
 		}
-		// check size
-		totalSize += size
-		if totalSize > maxTotalBytes {
-			return "", totalSize, fmt.Errorf("total size would exceed limit of %d bytes", maxTotalBytes)
-		}
-		// add to builder
-		builder.Write(s)
+		// the shared budget has already enforced the size limit
+		totalSize += results[i].size
+		outputSize += len(codeFence) + len(fname) + len(results[i].data) + len(codeFence)
+	}
 
-		end := []byte("```")
-		builder.Write(end)
+	builder := strings.Builder{}
+	builder.Grow(outputSize)
+	for i, fname := range filenames {
+		builder.WriteString(codeFence)
+		builder.WriteString(fname)
+		// add to builder
+		builder.Write(results[i].data)
+		builder.WriteString(codeFence)
 	}
 
 	return builder.String(), totalSize, nil
@@ -6,14 +6,44 @@ package util
 
 import (
 	"fmt"
+	"net/http"
 	"net/url"
+	"regexp"
 	"strings"
+	"sync"
 
 	"github.com/gocolly/colly/v2"
 )
 
 const MaxScraperDepth = 2
 
+// maxConcurrentScrapes limits the number of URLs ScrapeAll fetches at the same time
+const maxConcurrentScrapes = 8
+
+// scraperTransport is shared by the collectors created in ScrapeURL, so
+// connections to a host are kept alive and reused across calls instead of
+// paying a new TCP and TLS handshake for every URL.
+var scraperTransport = newScraperTransport()
+
+// newScraperTransport returns a copy of the default transport that keeps
+// enough idle connections per host for concurrent scrapes of the same site.
+func newScraperTransport() *http.Transport {
+	transport := http.DefaultTransport.(*http.Transport).Clone()
+	transport.MaxIdleConnsPerHost = maxConcurrentScrapes
+	return transport
+}
+
+// blankLines matches a run of blank or whitespace-only lines, compiled once at startup
+var blankLines = regexp.MustCompile(`\n\s*\n+`)
+
+// cleanScrapedText removes the blank lines left in the text of a page by its
+// layout, so the text sent to the model is smaller. Whitespace within lines is
+// kept, since indentation is significant in scraped code blocks.
+func cleanScrapedText(text string) string {
+	text = blankLines.ReplaceAllString(text, "\n")
+	return strings.TrimSpace(text)
+}
+
 // ScrapeURL scrapes the content from a single URL and returns it as a string.
 //
 // Parameters:
@@ -47,6 +77,7 @@ func ScrapeURL(link string) (string, error) {
 		colly.AllowURLRevisit(),
 		colly.MaxDepth(MaxScraperDepth),
 	)
+	c.WithTransport(scraperTransport)
 
 	// Store scraped content
 	var content strings.Builder
@@ -68,11 +99,12 @@ func ScrapeURL(link string) (string, error) {
 		return "", fmt.Errorf("failed to scrape URL %s: %w", link, err)
 	}
 
-	text := fmt.Sprintf("```%s\n%s```\n", link, content.String())
+	text := fmt.Sprintf("```%s\n%s\n```\n", link, cleanScrapedText(content.String()))
 	return text, nil
 }
 
 // ScrapeAll scrapes content from multiple URLs and concatenates the results.
+// The URLs are fetched concurrently and concatenated in the order given.
 //
 // Parameters:
 //   - urls: A slice of URLs to scrape (must be valid HTTP/HTTPS URLs)
@@ -98,13 +130,33 @@ func ScrapeAll(urls []string) (string, error) {
 		return "", fmt.Errorf("URLs list cannot be empty")
 	}
 
+	// Scrape the URLs concurrently, each result is stored at its input index
+	type result struct {
+		content string
+		err     error
+	}
+	results := make([]result, len(urls))
+	sem := make(chan struct{}, maxConcurrentScrapes)
+	var wg sync.WaitGroup
+	for i, url := range urls {
+		wg.Add(1)
+		go func(i int, url string) {
+			defer wg.Done()
+			sem <- struct{}{}
+			defer func() { <-sem }()
+			content, err := ScrapeURL(url)
+			results[i] = result{content: content, err: err}
+		}(i, url)
+	}
+	wg.Wait()
+
 	// Store combined content
 	var allContent strings.Builder
 	successCount := 0
 
-	// Scrape each URL
-	for _, url := range urls {
-		content, err := ScrapeURL(url)
+	// Combine the results in the order given
+	for i, url := range urls {
+		content, err := results[i].content, results[i].err
 		if err != nil {
 			return "", fmt.Errorf("failed to scrape URL %s: %w", url, err)
 		}
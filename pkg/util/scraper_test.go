@@ -1,11 +1,66 @@
 package util
 
 import (
+	"io"
+	"net/http"
+	"net/http/httptest"
 	"strings"
 	"testing"
 )
 
+// testPage is the HTML served by newTestSite
+const testPage = `<html><head><title>Example Domain</title></head>
+<body>
+    <h1>Example Domain</h1>
+    <p>This domain is for use in illustrative examples in documents.</p>
+</body></html>`
+
+// newTestSite starts a local server that serves testPage for every path,
+// so the scraper tests do not depend on the network.
+func newTestSite(t *testing.T) *httptest.Server {
+	t.Helper()
+	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		w.Header().Set("Content-Type", "text/html; charset=utf-8")
+		io.WriteString(w, testPage)
+	}))
+	t.Cleanup(srv.Close)
+	return srv
+}
+
+// closedSiteURL returns the URL of a local server that is no longer listening.
+func closedSiteURL(t *testing.T) string {
+	t.Helper()
+	srv := httptest.NewServer(http.NotFoundHandler())
+	srv.Close()
+	return srv.URL
+}
+
+func TestCleanScrapedText(t *testing.T) {
+	tests := []struct {
+		name string
+		text string
+		want string
+	}{
+		{name: "Plain text", text: "Example Domain", want: "Example Domain"},
+		{name: "Surrounding whitespace", text: "\n\n  Example Domain \n\n", want: "Example Domain"},
+		{name: "Blank lines", text: "Title\n\n   \n\t\nBody", want: "Title\nBody"},
+		{name: "Spaces kept", text: "Home    About\t\tContact", want: "Home    About\t\tContact"},
+		{name: "Indentation kept", text: "func main() {\n\n    fmt.Println()\n}", want: "func main() {\n    fmt.Println()\n}"},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := cleanScrapedText(tt.text); got != tt.want {
+				t.Errorf("cleanScrapedText() = %q, want %q", got, tt.want)
+			}
+		})
+	}
+}
+
 func TestScrapeURL(t *testing.T) {
+	site := newTestSite(t)
+	unreachable := closedSiteURL(t)
+
 	tests := []struct {
 		name    string
 		url     string
@@ -14,8 +69,8 @@ func TestScrapeURL(t *testing.T) {
 		want    string
 	}{
 		{
-			name:    "Valid URL - Example.com",
-			url:     "https://example.com",
+			name:    "Valid URL",
+			url:     site.URL,
 			wantErr: false,
 			want:    "Example Domain",
 		},
@@ -32,8 +87,8 @@ func TestScrapeURL(t *testing.T) {
 			errMsg:  "failed to scrape",
 		},
 		{
-			name:    "Non-existent domain",
-			url:     "https://this-domain-should-not-exist-123456789.com",
+			name:    "Unreachable site",
+			url:     unreachable,
 			wantErr: true,
 			errMsg:  "failed to scrape",
 		},
@@ -65,6 +120,9 @@ func TestScrapeURL(t *testing.T) {
 }
 
 func TestScrapeAll(t *testing.T) {
+	site := newTestSite(t)
+	unreachable := closedSiteURL(t)
+
 	tests := []struct {
 		name    string
 		urls    []string
@@ -75,8 +133,8 @@ func TestScrapeAll(t *testing.T) {
 		{
 			name: "Multiple valid URLs",
 			urls: []string{
-				"https://example.com",
-				"https://example.org",
+				site.URL + "/one",
+				site.URL + "/two",
 			},
 			wantErr: false,
 			want:    "Example Domain",
@@ -90,9 +148,9 @@ func TestScrapeAll(t *testing.T) {
 		{
 			name: "Mix of valid and invalid URLs",
 			urls: []string{
-				"https://example.com",
+				site.URL,
 				"not-a-url",
-				"https://this-domain-should-not-exist-123456789.com",
+				unreachable,
 			},
 			wantErr: true,
 			want:    "Example Domain",
@@ -101,7 +159,7 @@ func TestScrapeAll(t *testing.T) {
 			name: "All invalid URLs",
 			urls: []string{
 				"not-a-url",
-				"https://this-domain-should-not-exist-123456789.com",
+				unreachable,
 			},
 			wantErr: true,
 			errMsg:  "failed to scrape",
@@ -61,3 +61,47 @@ func TestReadFile(t *testing.T) {
 		})
 	}
 }
+
+// Test that ReadFiles concatenates the files in the order given
+func TestReadFiles(t *testing.T) {
+	var names []string
+	var want strings.Builder
+	for i := 0; i < 20; i++ {
+		f, err := os.CreateTemp("", "read-files")
+		if err != nil {
+			t.Fatal(err)
+		}
+		defer os.Remove(f.Name())
+
+		content := strings.Repeat(string(rune('a'+i)), 1024*(i+1))
+		if _, err := f.WriteString(content); err != nil {
+			t.Fatal(err)
+		}
+		f.Close()
+
+		names = append(names, f.Name())
+		want.WriteString("```" + f.Name() + content + "```")
+	}
+
+	got, size, err := ReadFiles(names, 1024*1024)
+	if err != nil {
+		t.Fatalf("ReadFiles() error = %v", err)
+	}
+	if got != want.String() {
+		t.Errorf("ReadFiles() content out of order or incomplete")
+	}
+	if size != int64(1024*20*21/2) {
+		t.Errorf("ReadFiles() size = %v, want %v", size, 1024*20*21/2)
+	}
+
+	_, _, err = ReadFiles(append(names, "does-not-exist"), 1024*1024)
+	if err == nil {
+		t.Errorf("ReadFiles() error = nil for missing file")
+	}
+
+	// the limit applies to the files together, not to each file
+	_, _, err = ReadFiles(names, int64(1024*20*21/2)-1)
+	if err == nil || !strings.HasPrefix(err.Error(), "total size would exceed limit") {
+		t.Errorf("ReadFiles() error = %v, want size limit error", err)
+	}
+}